@@ -1,8 +1,13 @@
+import functools
 import logging
 import logging.config
 import os
+import threading
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar, Union, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+Message = Union[str, Callable[[], str]]
 
 PACKAGE_LOGGER = __name__.split(".")[0]
 
@@ -45,14 +50,99 @@ class LogLevel(str, Enum):
     CRITICAL = "critical"
 
 
+class HotLogger:
+    """Logger for hot paths that caches which levels are enabled.
+
+    `debug_enabled` and `info_enabled` are plain attributes, refreshed whenever the
+    levels are changed through this module. Guarding a log statement with them
+    skips the method call, the level check and the message arguments:
+
+        if logger.debug_enabled:
+            logger.debug("state: %s", expensive_repr(state))
+
+    Messages may also be zero-argument callables that are only evaluated when the
+    record is emitted. After changing levels with `logging` directly, call
+    `refresh_levels`.
+    """
+
+    __slots__ = ("logger", "debug_enabled", "info_enabled")
+
+    def __init__(self, logger: logging.Logger):
+        """Wrap `logger` and cache its enabled levels."""
+        self.logger = logger
+        self.debug_enabled = False
+        self.info_enabled = False
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Update the cached level flags from the wrapped logger."""
+        self.debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        self.info_enabled = self.logger.isEnabledFor(logging.INFO)
+
+    def debug(self, msg: Message, *args: object) -> None:
+        """Log `msg` at DEBUG level if enabled."""
+        if self.debug_enabled:
+            self.logger.debug(_evaluate(msg), *args, stacklevel=2)
+
+    def info(self, msg: Message, *args: object) -> None:
+        """Log `msg` at INFO level if enabled."""
+        if self.info_enabled:
+            self.logger.info(_evaluate(msg), *args, stacklevel=2)
+
+    def debug_only(self, func: F) -> F:
+        """Decorate a function that only runs while DEBUG is enabled.
+
+        Useful for debug helpers such as state dumps; while DEBUG is disabled the
+        call returns None without running the function body.
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if self.debug_enabled:
+                return func(*args, **kwargs)
+            return None
+
+        return cast(F, wrapper)
+
+
+_hot_loggers: dict[str, HotLogger] = {}
+# Guards LOGGING_CONFIG, the logging configuration and `_hot_loggers`; without the
+# GIL (free-threaded builds) concurrent updates would otherwise interleave.
+_config_lock = threading.RLock()
+
+
+def _evaluate(msg: Message) -> str:
+    return msg() if callable(msg) else msg
+
+
+def refresh_levels() -> None:
+    """Update the cached level flags of all hot loggers."""
+    with _config_lock:
+        for hot_logger in _hot_loggers.values():
+            hot_logger.refresh()
+
+
 def set_level(level: Optional[str]) -> None:
     """Set the logging level."""
     if level is not None:
-        LOGGING_CONFIG["loggers"][PACKAGE_LOGGER]["level"] = level.upper()
-        logging.config.dictConfig(LOGGING_CONFIG)
+        with _config_lock:
+            LOGGING_CONFIG["loggers"][PACKAGE_LOGGER]["level"] = level.upper()
+            logging.config.dictConfig(LOGGING_CONFIG)
+            refresh_levels()
 
 
 def get_logger(name: str) -> logging.Logger:
     """Get the logger."""
-    logging.config.dictConfig(LOGGING_CONFIG)
+    with _config_lock:
+        logging.config.dictConfig(LOGGING_CONFIG)
+        refresh_levels()
     return logging.getLogger(name)
+
+
+def get_hot_logger(name: str) -> HotLogger:
+    """Get the hot path logger for `name`, creating it on first use."""
+    with _config_lock:
+        logger = get_logger(name)
+        if name not in _hot_loggers:
+            _hot_loggers[name] = HotLogger(logger)
+        return _hot_loggers[name]
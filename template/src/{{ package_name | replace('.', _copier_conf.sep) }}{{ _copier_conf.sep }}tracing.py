@@ -0,0 +1,313 @@
+"""Lightweight tracing spans exported to a local trace file.
+
+Spans measure nested wall-clock durations. The current span is tracked with a
+`contextvars.ContextVar`, so concurrent threads and asyncio tasks each build their
+own span tree. To keep a parent span when handing work to a thread pool, submit
+the callable through `contextvars.copy_context().run`.
+
+Tracing is disabled until `configure` is called. While disabled, `span` returns a
+shared no-op object and `traced` returns the decorated function unchanged, so it
+costs nothing. Functions are therefore only traced when they are decorated after
+`configure`, that is when their module is imported once tracing is enabled.
+
+Finished spans are buffered and written in batches either as Chrome trace events
+(`.json`, loadable in https://ui.perfetto.dev or `chrome://tracing`) or as newline
+delimited JSON (`.ndjson`/`.jsonl`).
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    TextIO,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_BATCH_SIZE = 512
+
+_span_ids = itertools.count(1)
+# next() on a shared iterator is not atomic on free-threaded builds
+_span_ids_lock = threading.Lock()
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_exporter: Optional[FileExporter] = None
+
+
+class Span:
+    """A timed operation, possibly nested inside a parent span."""
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "span_id",
+        "parent_id",
+        "thread_id",
+        "start_ns",
+        "end_ns",
+        "_token",
+    )
+
+    def __init__(self, name: str, attributes: Optional[dict[str, Any]] = None):
+        """Create an unstarted span; it is timed when entered as a context."""
+        self.name = name
+        self.attributes = attributes
+        self.span_id = 0
+        self.parent_id: Optional[int] = None
+        self.thread_id = 0
+        self.start_ns = 0
+        self.end_ns = 0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        if self.attributes is None:
+            self.attributes = {}
+        self.attributes[key] = value
+
+    @property
+    def duration_ns(self) -> int:
+        """Duration of the finished span in nanoseconds."""
+        return self.end_ns - self.start_ns
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent is not None else None
+        with _span_ids_lock:
+            self.span_id = next(_span_ids)
+        self.thread_id = threading.get_ident()
+        self._token = _current_span.set(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.end_ns = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.set_attribute("error", exc_type.__name__)
+        exporter = _exporter
+        if exporter is not None:
+            exporter.export(self)
+
+
+class _NoopSpan:
+    """Stand-in returned by `span` while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Discard the attribute."""
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class FileExporter:
+    """Buffer finished spans and append them to a trace file in batches."""
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        trace_format: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """Create an exporter writing `chrome` or `ndjson` records to `path`."""
+        self.path = Path(path)
+        if trace_format is None:
+            is_ndjson = self.path.suffix in (".ndjson", ".jsonl")
+            trace_format = "ndjson" if is_ndjson else "chrome"
+        if trace_format not in ("chrome", "ndjson"):
+            raise ValueError(f"Unknown trace format: {trace_format!r}")
+        self.trace_format = trace_format
+        self.batch_size = batch_size
+        self._pid = os.getpid()
+        self._buffer: list[Span] = []
+        self._lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+
+    def export(self, span: Span) -> None:
+        """Queue a finished span, writing the batch once it is full."""
+        with self._lock:
+            self._buffer.append(span)
+            if len(self._buffer) >= self.batch_size:
+                self._write_batch()
+
+    def flush(self) -> None:
+        """Write all queued spans."""
+        with self._lock:
+            self._write_batch()
+
+    def close(self) -> None:
+        """Write all queued spans and close the trace file."""
+        with self._lock:
+            self._write_batch()
+            if self._file is None:
+                return
+            if self.trace_format == "chrome":
+                # The closing bracket is optional for trace viewers, so a crashed
+                # process still leaves a loadable file behind.
+                metadata = {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "args": {"name": self.path.stem},
+                }
+                self._file.write(json.dumps(metadata) + "]\n")
+            self._file.close()
+            self._file = None
+
+    def _write_batch(self) -> None:
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("w", encoding="utf-8")
+            if self.trace_format == "chrome":
+                self._file.write("[\n")
+        if self.trace_format == "chrome":
+            lines = [json.dumps(self._chrome_event(s), default=str) for s in batch]
+            self._file.write(",\n".join(lines) + ",\n")
+        else:
+            lines = [json.dumps(self._ndjson_record(s), default=str) for s in batch]
+            self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+
+    def _chrome_event(self, span: Span) -> dict[str, Any]:
+        return {
+            "name": span.name,
+            "ph": "X",
+            "ts": span.start_ns / 1000,
+            "dur": span.duration_ns / 1000,
+            "pid": self._pid,
+            "tid": span.thread_id,
+            "args": span.attributes or {},
+        }
+
+    def _ndjson_record(self, span: Span) -> dict[str, Any]:
+        return {
+            "name": span.name,
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "thread_id": span.thread_id,
+            "start_ns": span.start_ns,
+            "duration_ns": span.duration_ns,
+            "attributes": span.attributes or {},
+        }
+
+
+def configure(
+    path: Union[str, os.PathLike[str]],
+    trace_format: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> FileExporter:
+    """Enable tracing and export finished spans to `path`.
+
+    The format is inferred from the file suffix unless `trace_format` is given.
+    Pending spans are written when the interpreter exits.
+    """
+    global _exporter
+    shutdown()
+    _exporter = FileExporter(path, trace_format, batch_size)
+    atexit.unregister(shutdown)
+    atexit.register(shutdown)
+    return _exporter
+
+
+def shutdown() -> None:
+    """Flush pending spans and disable tracing."""
+    global _exporter
+    exporter, _exporter = _exporter, None
+    if exporter is not None:
+        exporter.close()
+
+
+def is_enabled() -> bool:
+    """Whether spans are currently being recorded."""
+    return _exporter is not None
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost active span of the current context."""
+    return _current_span.get()
+
+
+def span(name: str, **attributes: Any) -> Union[Span, _NoopSpan]:
+    """Return a context manager timing the enclosed block as a span."""
+    if _exporter is None:
+        return _NOOP_SPAN
+    return Span(name, attributes or None)
+
+
+@overload
+def traced(func: F) -> F: ...
+
+
+@overload
+def traced(*, name: Optional[str] = None) -> Callable[[F], F]: ...
+
+
+def traced(
+    func: Optional[F] = None, *, name: Optional[str] = None
+) -> Union[F, Callable[[F], F]]:
+    """Decorate a function or coroutine function to run inside a span.
+
+    Can be used bare (`@traced`) or with a custom span name
+    (`@traced(name="load")`). The span name defaults to the qualified name of the
+    function. While tracing is disabled the function is returned unchanged.
+    """
+
+    def decorate(fn: F) -> F:
+        if _exporter is None:
+            return fn
+        span_name = name or fn.__qualname__
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _exporter is None:
+                    return await fn(*args, **kwargs)
+                with Span(span_name):
+                    return await fn(*args, **kwargs)
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _exporter is None:
+                return fn(*args, **kwargs)
+            with Span(span_name):
+                return fn(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    if func is not None:
+        return decorate(func)
+    return decorate
@@ -0,0 +1,133 @@
+"""Integration: parallel copy and update of many projects with tools/fleet.py."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+import yaml
+
+from tools import fleet
+
+from .conftest import git
+
+
+@pytest.fixture
+def template_repo(tmp_path_factory, copier):
+    template_path = tmp_path_factory.mktemp("fleet_template")
+    shutil.copytree(Path(copier.template), template_path, dirs_exist_ok=True)
+    git(template_path, "config", "user.name", "Template User")
+    git(template_path, "config", "user.email", "template@example.com")
+    return template_path
+
+
+def write_manifest(tmp_path, template_repo, names, copier):
+    answers_path = tmp_path / "answers.yml"
+    answers_path.write_text(yaml.safe_dump(copier.defaults))
+    manifest_path = tmp_path / "fleet.yml"
+    manifest_path.write_text(
+        yaml.safe_dump(
+            {
+                "template": str(template_repo),
+                "projects": [
+                    {"path": f"projects/{name}", "data_file": "answers.yml"}
+                    for name in names
+                ],
+            }
+        )
+    )
+    return fleet.Manifest.load(manifest_path)
+
+
+def commit_all(path, message):
+    git(path, "add", "-A")
+    git(
+        path,
+        "-c",
+        "user.name=User Name",
+        "-c",
+        "user.email=user@email.org",
+        "commit",
+        "-q",
+        "-m",
+        message,
+    )
+
+
+def release_template_change(template_repo, old, new):
+    pyproject_template = template_repo / "template" / "pyproject.toml.jinja"
+    content = pyproject_template.read_text()
+    pyproject_template.write_text(content.replace(old, new, 1))
+    commit_all(template_repo, "Template release")
+    git(template_repo, "tag", "999.999.999")
+
+
+def test_fleet_copies_then_updates_projects(tmp_path, template_repo, copier):
+    manifest = write_manifest(tmp_path, template_repo, ["one", "two"], copier)
+    cache_dir = tmp_path / "cache"
+
+    copied = fleet.run_fleet(manifest, workers=2, cache_dir=cache_dir)
+
+    assert [(r.action, r.status) for r in copied] == [("copy", "ok"), ("copy", "ok")]
+    assert len(list(cache_dir.glob("*.git"))) == 1
+    for project in manifest.projects:
+        answers = (project.path / ".copier-answers.yml").read_text()
+        assert f"_src_path: {template_repo}" in answers
+        git(project.path, "init", "-q")
+        commit_all(project.path, "init")
+
+    release_template_change(template_repo, "[tool.uv]", "# fleet marker\n[tool.uv]")
+    updated = fleet.run_fleet(manifest, workers=2, cache_dir=cache_dir)
+
+    assert [(r.action, r.status) for r in updated] == [
+        ("update", "ok"),
+        ("update", "ok"),
+    ]
+    for project in manifest.projects:
+        assert "# fleet marker" in (project.path / "pyproject.toml").read_text()
+
+
+def test_fleet_reports_conflicts(tmp_path, template_repo, copier):
+    manifest = write_manifest(tmp_path, template_repo, ["clean", "edited"], copier)
+    fleet.run_fleet(manifest, workers=2, cache_dir=tmp_path / "cache")
+    for project in manifest.projects:
+        git(project.path, "init", "-q")
+        commit_all(project.path, "init")
+    edited_pyproject = manifest.projects[1].path / "pyproject.toml"
+    edited_pyproject.write_text(
+        edited_pyproject.read_text().replace(
+            'add-bounds = "major"', 'add-bounds = "minor"'
+        )
+    )
+    commit_all(manifest.projects[1].path, "Project change")
+
+    release_template_change(
+        template_repo, 'add-bounds = "major"', 'add-bounds = "exact"'
+    )
+    results = fleet.run_fleet(manifest, workers=2, cache_dir=tmp_path / "cache")
+
+    assert [(r.path.name, r.status) for r in results] == [
+        ("clean", "ok"),
+        ("edited", "conflict"),
+    ]
+    assert results[1].conflicts == ["pyproject.toml"]
+
+
+def test_fleet_main_writes_json_report(tmp_path, template_repo, copier):
+    manifest = write_manifest(tmp_path, template_repo, ["broken"], copier)
+    (tmp_path / "answers.yml").write_text(yaml.safe_dump({"package_name": "1bad"}))
+    report_path = tmp_path / "report.json"
+
+    exit_code = fleet.main(
+        [
+            str(tmp_path / "fleet.yml"),
+            "--cache-dir",
+            str(tmp_path / "cache"),
+            "--json",
+            str(report_path),
+        ]
+    )
+
+    assert exit_code == 1
+    report = yaml.safe_load(report_path.read_text())
+    assert report[0]["status"] == "failed"
+    assert report[0]["path"] == str(manifest.projects[0].path)
@@ -1,3 +1,6 @@
+import os
+import time
+
 import pytest
 
 
@@ -36,3 +39,85 @@ def test_just_build(tmp_path, copier):
         project.path / "dist" / f"{package_name}-{package_version}-py3-none-any.whl"
     )
     assert python_wheel_path.exists()
+
+
+@pytest.mark.venv
+def test_just_build_with_mypyc(tmp_path, copier):
+    custom_answers = {
+        "package_type": "cli",
+        "type_checker": "mypy",
+        "type_checker_strictness": "strict",
+        "compile_with_mypyc": True,
+        "generate_example_code": True,
+    }
+    project = copier.copy(tmp_path, **custom_answers)
+    project.run("uv sync --no-install-project")
+
+    project.run("just build")
+
+    wheel_path = next((project.path / "dist").glob("*.whl"))
+    assert not wheel_path.name.endswith("-py3-none-any.whl")
+    assert not list((project.path / "src").rglob("*.so"))
+    with_wheel = f"uv run --isolated --no-project --with {wheel_path} --with pytest"
+    project.run(
+        f"{with_wheel} python -c 'import python_boilerplate.core as core;"
+        ' assert not core.__file__.endswith(".py")\''
+    )
+    project.run(f"{with_wheel} pytest -o pythonpath= -p no:cacheprovider")
+
+
+def min_startup_seconds(project, command, runs=5):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        project.run(command)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.mark.venv
+def test_just_build_zipapp(tmp_path, copier):
+    custom_answers = {
+        "package_type": "cli",
+        "generate_example_code": True,
+    }
+    project = copier.copy(tmp_path, **custom_answers)
+    project.run("uv sync")
+
+    # Everything the zipapp needs is already in the uv cache after the sync
+    project.run("just build-zipapp", env={**os.environ, "UV_OFFLINE": "1"})
+
+    zipapp_path = project.path / "dist" / "python_boilerplate.pyz"
+    assert os.access(zipapp_path, os.X_OK)
+    assert project.answers["version"] in project.run(f"{zipapp_path} --version")
+    zipapp_seconds = min_startup_seconds(project, f"{zipapp_path} --version")
+    uv_run_seconds = min_startup_seconds(project, "uv run python_boilerplate --version")
+    assert zipapp_seconds < uv_run_seconds
+
+
+# Installing from the wheelhouse with a cold uv cache, without the network
+MAX_SETUP_OFFLINE_SECONDS = 60
+
+
+@pytest.mark.venv
+def test_just_setup_offline(tmp_path, copier, record_property):
+    project = copier.copy(tmp_path, package_type="cli")
+    project.run("git init --quiet")
+    project.run("just wheelhouse")
+    project.run("rm -rf .venv")
+
+    # A fresh cache ensures everything is installed from the wheelhouse
+    offline_env = {
+        **os.environ,
+        "UV_OFFLINE": "1",
+        "UV_CACHE_DIR": str(tmp_path / "uv-cache"),
+        "PIP_NO_INDEX": "1",
+    }
+    start = time.perf_counter()
+    project.run("just setup-offline", env=offline_env)
+    setup_seconds = time.perf_counter() - start
+
+    record_property("setup_offline_seconds", round(setup_seconds, 1))
+    assert setup_seconds < MAX_SETUP_OFFLINE_SECONDS, f"took {setup_seconds:.1f} s"
+    assert (project.path / ".git" / "hooks" / "pre-commit").exists()
+    project.run("uv run pytest", env=offline_env)
@@ -2,6 +2,8 @@
 
 import pytest
 
+from tools import bench
+
 
 @pytest.mark.venv
 def test_bake_and_run_tests_with_pytest_framework(tmp_path, copier):
@@ -11,9 +13,92 @@ def test_bake_and_run_tests_with_pytest_framework(tmp_path, copier):
 
 
 @pytest.mark.venv
-def test_bake_and_run_cli(tmp_path, copier):
-    custom_answers = {"package_type": "cli"}
+def test_bake_and_run_tests_in_parallel(tmp_path, copier):
+    project = copier.copy(tmp_path, parallel_tests=True, generate_profiler=True)
+    project.run("uv sync")
+    results = tmp_path / "results"
+    results.mkdir()
+    (project.path / "tests" / "test_workers.py").write_text(
+        "import os\nfrom pathlib import Path\n\nimport pytest\n\n"
+        'RESULTS = Path(os.environ["RESULTS_DIR"])\n\n\n'
+        "@pytest.mark.serial\n"
+        '@pytest.mark.parametrize("index", range(4))\n'
+        "def test_serial(index):\n"
+        '    worker = os.environ["PYTEST_XDIST_WORKER"]\n'
+        '    (RESULTS / f"serial-{index}").write_text(worker)\n\n\n'
+        '@pytest.mark.parametrize("index", range(8))\n'
+        "def test_port(index, unused_port, worker_tmp_path):\n"
+        '    (RESULTS / f"port-{index}").write_text(str(unused_port))\n'
+        "    assert worker_tmp_path.is_dir()\n"
+    )
+
+    output = project.run(f"RESULTS_DIR={results} uv run pytest -n 4")
+
+    assert "4 workers [" in output
+    serial_workers = {path.read_text() for path in results.glob("serial-*")}
+    assert len(serial_workers) == 1
+    ports = [path.read_text() for path in results.glob("port-*")]
+    assert len(ports) == len(set(ports)) == 8
+
+
+@pytest.mark.venv
+@pytest.mark.parametrize("cli_framework", ["typer", "argparse"])
+def test_bake_and_run_cli(tmp_path, copier, cli_framework):
+    custom_answers = {"package_type": "cli", "cli_framework": cli_framework}
     project = copier.copy(tmp_path, **custom_answers)
     project.run("uv sync")
 
     project.run("uv run python_boilerplate")
+    project.run("uv run pytest tests/test_cli.py")
+
+
+@pytest.mark.venv
+@pytest.mark.parametrize("cli_framework", ["typer", "argparse"])
+def test_bake_namespaced_cli_and_lint(tmp_path, copier, cli_framework):
+    custom_answers = {
+        "package_name": "company.mypackage",
+        "package_type": "cli",
+        "cli_framework": cli_framework,
+        "use_lint_strict_rules": True,
+    }
+    project = copier.copy(tmp_path, **custom_answers)
+    project.run("uv sync")
+
+    project.run("uv run ruff check --no-fix .")
+    project.run("uv run pytest tests/test_cli.py")
+
+
+@pytest.mark.venv
+def test_argparse_cli_starts_faster_than_typer(tmp_path, copier):
+    startup_seconds = {}
+    for cli_framework in ["typer", "argparse"]:
+        project = copier.copy(
+            tmp_path / cli_framework, package_type="cli", cli_framework=cli_framework
+        )
+        project.run("uv sync")
+        script = project.path / ".venv" / "bin" / "python_boilerplate"
+        startup_seconds[cli_framework] = bench.min_seconds(
+            [str(script), "--version"], project.path, repeat=5
+        )
+
+    assert startup_seconds["argparse"] < startup_seconds["typer"]
+
+
+@pytest.mark.venv
+def test_test_duration_budget(tmp_path, copier):
+    project = copier.copy(tmp_path)
+    project.run("uv sync")
+    (project.path / "tests" / "test_slow.py").write_text(
+        "import os\nimport time\n\n\n"
+        "def test_slow():\n"
+        '    time.sleep(float(os.environ["SLEEP_SECONDS"]))\n'
+    )
+    pytest_command = "uv run pytest -o duration_fail=true tests/test_slow.py"
+
+    output = project.run(f"SLEEP_SECONDS=0.2 {pytest_command}")
+    assert "slowest 1 tests:" in output
+
+    with pytest.raises(RuntimeError) as exc_info:
+        project.run(f"SLEEP_SECONDS=0.5 {pytest_command}")
+    assert "slowed down by more than 50%" in str(exc_info.value)
+    assert "over budget" not in str(exc_info.value)
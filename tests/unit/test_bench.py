@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from tools import bench
+
+
+def results(**metrics):
+    return {"profiles": {"cli-defaults": metrics}}
+
+
+@pytest.mark.parametrize(
+    ("baseline", "current", "regressed"),
+    [
+        ({"render_seconds": 0.3}, {"render_seconds": 0.32}, False),
+        ({"version_seconds": 0.18}, {"version_seconds": 0.38}, True),
+        ({"import_seconds": 0.015}, {"import_seconds": 0.03}, False),
+        ({"files": 28}, {"files": 40}, True),
+        ({}, {"files": 40}, False),
+    ],
+)
+def test_compare(baseline, current, regressed):
+    regressions = bench.compare(
+        results(**baseline), results(**current), tolerance=0.2, min_delta=0.05
+    )
+
+    assert bool(regressions) is regressed
+
+
+def test_profile_data_uses_defaults_except_identity():
+    test_answers = {key: f"{key}-value" for key in bench.IDENTITY_KEYS}
+    test_answers["type_checker"] = "mypy"
+
+    data = bench.PROFILES["library-defaults"].data(test_answers)
+
+    assert "type_checker" not in data
+    assert data["package_type"] == "library"
+    assert data["author_name"] == "author_name-value"
+
+
+def test_main_renders_and_compares_with_baseline(tmp_path, capsys):
+    args = [
+        "--profile",
+        "library-defaults",
+        "--repeat",
+        "1",
+        "--no-sync",
+        "--output",
+        str(tmp_path / "results.json"),
+        "--baseline",
+        str(tmp_path / "baseline.json"),
+    ]
+
+    assert bench.main([*args, "--save-baseline"]) == 0
+    baseline = json.loads((tmp_path / "baseline.json").read_text())
+    baseline["profiles"]["library-defaults"]["files"] //= 2
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline))
+
+    assert bench.main(args) == 1
+    assert "REGRESSION" in capsys.readouterr().out
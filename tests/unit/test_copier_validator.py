@@ -148,3 +148,39 @@ def test_validate_uv_version_invalid(tmp_path, copier, uv_version):
 
     with pytest.raises(ValueError, match="uv version must follow semantic versioning"):
         copier.copy(tmp_path, **custom_answers)
+
+
+@pytest.mark.parametrize("mypyc_modules", ["", "core,", "core utils", "Core"])
+def test_validate_mypyc_modules_invalid(tmp_path, copier, mypyc_modules):
+    custom_answers = {
+        "type_checker": "mypy",
+        "compile_with_mypyc": True,
+        "mypyc_modules": mypyc_modules,
+    }
+
+    with pytest.raises(ValueError, match="mypyc modules must be a comma-separated"):
+        copier.copy(tmp_path, **custom_answers)
+
+
+@pytest.mark.parametrize(
+    ("type_checker", "type_checker_strictness"),
+    [("none", "strict"), ("mypy", "gradual")],
+)
+def test_validate_compile_with_mypyc_requires_strict_mypy(
+    tmp_path, copier, type_checker, type_checker_strictness
+):
+    custom_answers = {
+        "type_checker": type_checker,
+        "type_checker_strictness": type_checker_strictness,
+        "compile_with_mypyc": True,
+    }
+
+    with pytest.raises(ValueError, match="mypyc compilation requires the mypy"):
+        copier.copy(tmp_path, **custom_answers)
+
+
+def test_validate_free_threaded_python_requires_313(tmp_path, copier):
+    custom_answers = {"python_version": "3.12", "free_threaded_python": True}
+
+    with pytest.raises(ValueError, match="Free-threaded Python requires"):
+        copier.copy(tmp_path, **custom_answers)
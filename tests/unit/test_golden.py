@@ -0,0 +1,61 @@
+import pytest
+
+from tools import golden
+
+
+@pytest.fixture(scope="session")
+def golden_template(tmp_path_factory):
+    return golden.copy_template(tmp_path_factory.mktemp("golden") / "template")
+
+
+@pytest.mark.parametrize("profile", golden.PROFILES.values(), ids=golden.PROFILES)
+def test_rendered_tree_matches_golden(tmp_path, golden_template, profile):
+    result = golden.check_profile(profile, golden_template, tmp_path)
+
+    if result is not None:
+        pytest.fail(result, pytrace=False)
+
+
+def test_normalize_replaces_render_specific_content():
+    answers = b"_commit: f1b3ac8\n_src_path: /tmp/copier-123/template\nlicense: MIT\n"
+    license_text = b"Copyright (c) 2026, The User\n"
+
+    assert (
+        golden.normalize(".copier-answers.yml", answers)
+        == b"_commit: <commit>\n_src_path: <template>\nlicense: MIT\n"
+    )
+    assert (
+        golden.normalize("LICENSE", license_text) == b"Copyright (c) <year>, The User\n"
+    )
+    assert golden.normalize("README.md", license_text) == license_text
+
+
+def test_compare_lists_added_removed_and_changed_files():
+    changes = golden.compare(
+        {"README.md": "a", "LICENSE": "b", "old.py": "c"},
+        {"README.md": "a", "LICENSE": "B", "new.py": "d"},
+    )
+
+    assert changes.added == ["new.py"]
+    assert changes.removed == ["old.py"]
+    assert changes.changed == ["LICENSE"]
+    assert not golden.compare({"README.md": "a"}, {"README.md": "a"})
+
+
+def test_report_shows_file_diff(tmp_path):
+    reference = tmp_path / "reference"
+    current = tmp_path / "current"
+    for root, content in [(reference, "old line\n"), (current, "new line\n")]:
+        root.mkdir()
+        (root / "README.md").write_text(content)
+
+    result = golden.report(
+        golden.PROFILES["cli-defaults"],
+        golden.Changes(changed=["README.md"]),
+        current,
+        reference,
+    )
+
+    assert "changed: README.md" in result
+    assert "-old line" in result
+    assert "+new line" in result
@@ -54,6 +54,20 @@ def test_bake_library(tmp_path, copier):
     assert not found_cli_script
 
 
+@pytest.mark.parametrize("cli_framework", ["typer", "argparse"])
+def test_bake_cli_framework(tmp_path, copier, cli_framework):
+    project = copier.copy(tmp_path, package_type="cli", cli_framework=cli_framework)
+
+    pyproject_content = (project.path / "pyproject.toml").read_text()
+    assert ('"typer>=' in pyproject_content) is (cli_framework == "typer")
+    cli_content = (project.path / "src" / "python_boilerplate" / "cli.py").read_text()
+    assert ("import typer" in cli_content) is (cli_framework == "typer")
+    assert ("import argparse" in cli_content) is (cli_framework == "argparse")
+    for envvar in ["LOG_LEVEL", "TRACE_FILE", "STATS"]:
+        assert f'"{envvar}"' in cli_content
+    assert (project.path / "tests" / "test_cli.py").exists()
+
+
 def test_bake_namespaced_library(tmp_path, copier):
     custom_answers = {
         "package_type": "library",
@@ -230,6 +244,8 @@ def test_bake_namespaced_package_with_many_files(tmp_path, copier):
     assert mkdocs_config_filepath.exists() is True
     assert mkdocs_dir_path.exists() is True
     assert dockerfile_path.exists() is True
+    pyproject_content = (project.path / "pyproject.toml").read_text()
+    assert f'"src/{package_namespace}/cli.py" = ["T20"]' in pyproject_content
 
 
 @pytest.mark.parametrize("git_hosting", ["github", "gitlab"])
@@ -322,3 +338,204 @@ def test_bake_without_selecting_linting_components(tmp_path, copier):
     pyproject_content = pyproject_path.read_text()
     assert '"D"' in pyproject_content
     assert "[tool.ruff.lint.pydocstyle]" in pyproject_content
+
+
+def test_bake_with_tracing(tmp_path, copier):
+    project = copier.copy(tmp_path, package_type="cli", generate_example_code=True)
+
+    package_path = project.path / "src" / "python_boilerplate"
+    assert (package_path / "tracing.py").exists()
+    assert "@tracing.traced" in (package_path / "core.py").read_text()
+    assert 'envvar="TRACE_FILE"' in (package_path / "cli.py").read_text()
+    assert (project.path / "tests" / "test_tracing.py").exists()
+    assert (project.path / "tests" / "benchmarks" / "test_tracing_overhead.py").exists()
+    pyproject_content = (project.path / "pyproject.toml").read_text()
+    assert "addopts = \"-m 'not benchmark'\"" in pyproject_content
+
+
+def test_bake_with_lazy_exports(tmp_path, copier):
+    custom_answers = {
+        "package_name": "company.mypackage",
+        "generate_example_code": True,
+        "generate_io_helpers": False,
+    }
+
+    project = copier.copy(tmp_path, **custom_answers)
+
+    init_path = project.path / "src" / "company" / "mypackage" / "__init__.py"
+    init_content = init_path.read_text()
+    assert "from company.mypackage import logs, stats, tracing" in init_content
+    assert "from company.mypackage.core import a_function" in init_content
+    assert '"a_function": "core",' in init_content
+    assert '"io": "io",' not in init_content
+    assert "def __getattr__(name: str) -> Any:" in init_content
+    assert (project.path / "tests" / "test_lazy_exports.py").exists()
+
+
+def test_bake_with_resource_stats(tmp_path, copier):
+    project = copier.copy(tmp_path, package_type="cli")
+
+    package_path = project.path / "src" / "python_boilerplate"
+    assert (package_path / "stats.py").exists()
+    cli_content = (package_path / "cli.py").read_text()
+    assert '"--stats"' in cli_content
+    assert 'envvar="STATS_FILE"' in cli_content
+    assert (project.path / "tests" / "test_stats.py").exists()
+    assert (project.path / "tests" / "benchmarks" / "test_stats_overhead.py").exists()
+
+
+def test_bake_with_hot_path_logging(tmp_path, copier):
+    project = copier.copy(tmp_path, generate_example_code=True)
+
+    package_path = project.path / "src" / "python_boilerplate"
+    assert "def get_hot_logger(" in (package_path / "logs.py").read_text()
+    assert "if logger.debug_enabled:" in (package_path / "core.py").read_text()
+    benchmarks_path = project.path / "tests" / "benchmarks"
+    assert (benchmarks_path / "test_logging_overhead.py").exists()
+
+
+@pytest.mark.parametrize("generate_io_helpers", [True, False])
+def test_bake_with_io_helpers(tmp_path, copier, generate_io_helpers):
+    project = copier.copy(tmp_path, generate_io_helpers=generate_io_helpers)
+
+    io_module_path = project.path / "src" / "python_boilerplate" / "io.py"
+    assert io_module_path.exists() is generate_io_helpers
+    assert (project.path / "tests" / "test_io.py").exists() is generate_io_helpers
+    benchmark_path = project.path / "tests" / "benchmarks" / "test_io_throughput.py"
+    assert benchmark_path.exists() is generate_io_helpers
+
+
+@pytest.mark.parametrize("generate_profiler", [True, False])
+def test_bake_with_profiler(tmp_path, copier, generate_profiler):
+    project = copier.copy(
+        tmp_path, package_type="cli", generate_profiler=generate_profiler
+    )
+
+    package_path = project.path / "src" / "python_boilerplate"
+    assert (package_path / "profiling.py").exists() is generate_profiler
+    cli_content = (package_path / "cli.py").read_text()
+    assert ('envvar="PROFILE_FILE"' in cli_content) is generate_profiler
+    assert (project.path / "tests" / "test_profiling.py").exists() is generate_profiler
+    benchmark_path = project.path / "tests" / "benchmarks" / "test_profiler_overhead.py"
+    assert benchmark_path.exists() is generate_profiler
+
+
+@pytest.mark.parametrize("parallel_tests", [True, False])
+def test_bake_with_parallel_tests(tmp_path, copier, parallel_tests):
+    project = copier.copy(tmp_path, parallel_tests=parallel_tests)
+
+    pyproject_content = (project.path / "pyproject.toml").read_text()
+    assert ('"pytest-xdist>=' in pyproject_content) is parallel_tests
+    assert ("-n auto --dist loadgroup" in pyproject_content) is parallel_tests
+    conftest_content = (project.path / "tests" / "conftest.py").read_text()
+    assert ("def unused_port(" in conftest_content) is parallel_tests
+    justfile_content = (project.path / "justfile").read_text()
+    assert ("test-serial:" in justfile_content) is parallel_tests
+    assert ("-m benchmark -s -n 0" in justfile_content) is parallel_tests
+
+
+@pytest.mark.parametrize("generate_checkpoint", [True, False])
+def test_bake_with_checkpoint(tmp_path, copier, generate_checkpoint):
+    project = copier.copy(
+        tmp_path, package_type="cli", generate_checkpoint=generate_checkpoint
+    )
+
+    package_path = project.path / "src" / "python_boilerplate"
+    assert (package_path / "checkpoint.py").exists() is generate_checkpoint
+    test_path = project.path / "tests" / "test_checkpoint.py"
+    assert test_path.exists() is generate_checkpoint
+    cli_content = (package_path / "cli.py").read_text()
+    assert ('envvar="CHECKPOINT_FILE"' in cli_content) is generate_checkpoint
+    assert ('"--resume"' in cli_content) is generate_checkpoint
+
+
+def test_bake_with_free_threaded_python(tmp_path, copier):
+    custom_answers = {
+        "python_version": "3.13",
+        "free_threaded_python": True,
+        "git_hosting": "github",
+        "generate_dockerfile": True,
+        "generate_example_code": True,
+    }
+
+    project = copier.copy(tmp_path, **custom_answers)
+
+    assert (project.path / ".python-version").read_text().strip() == "3.13t"
+    assert "Free Threading" in (project.path / "pyproject.toml").read_text()
+    ci_content = (project.path / ".github" / "workflows" / "ci.yml").read_text()
+    assert "sys._is_gil_enabled()" in ci_content
+    dockerfile_content = (project.path / "Dockerfile").read_text()
+    assert "RUN uv python install 3.13t" in dockerfile_content
+    assert "COPY --from=builder /python /python" in dockerfile_content
+    benchmarks_path = project.path / "tests" / "benchmarks"
+    assert (benchmarks_path / "test_thread_scaling.py").exists()
+
+
+def test_bake_with_memory_budget_fixtures(tmp_path, copier):
+    project = copier.copy(tmp_path, generate_example_code=True)
+
+    conftest_content = (project.path / "tests" / "conftest.py").read_text()
+    example_test_path = project.path / "tests" / "test_python_boilerplate.py"
+    assert "def memory_tracker()" in conftest_content
+    assert '@pytest.mark.memory_budget("' in example_test_path.read_text()
+
+
+def test_bake_with_test_duration_budget(tmp_path, copier):
+    project = copier.copy(tmp_path)
+
+    conftest_content = (project.path / "tests" / "conftest.py").read_text()
+    pyproject_content = (project.path / "pyproject.toml").read_text()
+    assert "class DurationBudget:" in conftest_content
+    assert "duration_budget = 1.0" in pyproject_content
+    assert "duration_fail = false" in pyproject_content
+
+
+def test_bake_with_mypyc(tmp_path, copier):
+    custom_answers = {
+        "type_checker": "mypy",
+        "type_checker_strictness": "strict",
+        "compile_with_mypyc": True,
+        "mypyc_modules": "core, logs",
+    }
+
+    project = copier.copy(tmp_path, **custom_answers)
+
+    pyproject_content = (project.path / "pyproject.toml").read_text()
+    assert "[tool.hatch.build.targets.wheel.hooks.mypyc]" in pyproject_content
+    assert '"src/python_boilerplate/core.py",' in pyproject_content
+    assert '"src/python_boilerplate/logs.py",' in pyproject_content
+    justfile_content = (project.path / "justfile").read_text()
+    assert "HATCH_BUILD_HOOK_ENABLE_MYPYC=true uv build" in justfile_content
+    assert (project.path / "tests" / "benchmarks" / "test_compiled.py").exists()
+
+
+@pytest.mark.parametrize(
+    ("generate_example_code", "module"), [(True, "core"), (False, "tracing")]
+)
+def test_bake_with_mypyc_default_modules(
+    tmp_path, copier, generate_example_code, module
+):
+    custom_answers = {
+        "type_checker": "mypy",
+        "type_checker_strictness": "strict",
+        "compile_with_mypyc": True,
+        "generate_example_code": generate_example_code,
+    }
+
+    project = copier.copy(tmp_path, **custom_answers)
+
+    pyproject_content = (project.path / "pyproject.toml").read_text()
+    assert f'"src/python_boilerplate/{module}.py",' in pyproject_content
+
+
+@pytest.mark.parametrize("task_runner", ["just", "make"])
+def test_bake_with_offline_setup(tmp_path, copier, task_runner):
+    project = copier.copy(tmp_path, task_runner=task_runner)
+
+    runner_file = "justfile" if task_runner == "just" else "Makefile"
+    runner_content = (project.path / runner_file).read_text()
+    assert "wheelhouse:" in runner_content
+    assert "setup-offline:" in runner_content
+    assert "--no-index --find-links wheelhouse/wheels" in runner_content
+    assert "wheelhouse/" in (project.path / ".gitignore").read_text()
+    assert "PRE_COMMIT_HOME" in (project.path / ".envrc").read_text()
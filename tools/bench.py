@@ -0,0 +1,378 @@
+"""Benchmark what the template costs the projects generated from it.
+
+For each answer profile the template is rendered and the generated project is
+measured:
+
+- `render_seconds`: time of `copier copy` from a plain copy of the template
+- `files`, `tree_bytes`: size of the generated tree
+- `sync_seconds`: `uv sync` of a fresh virtual environment from a warm local cache
+- `python_seconds`: start of the bare project interpreter, for reference
+- `import_seconds`: start of the interpreter importing the package
+- `version_seconds`: start of the CLI with `--version` (CLI profiles only)
+
+Timings are the minimum of several runs, so they describe a warm file system
+cache rather than the first start after a reboot. Results are written as JSON and
+compared with a baseline; a metric regresses when it grows by more than the
+tolerance and, for timings, also by more than a minimum absolute delta.
+
+Usage:
+    uv run python -m tools.bench --save-baseline   # on the main branch
+    uv run python -m tools.bench                   # on the feature branch
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+import copier
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TEMPLATE_PATHS = ["copier.yml", "template"]
+TEST_ANSWERS_FILE = REPO_ROOT / ".copier-answers.test.yml"
+BENCH_DIR = REPO_ROOT / ".bench"
+IDENTITY_KEYS = (
+    "author_name",
+    "author_email",
+    "package_name",
+    "distribution_name",
+    "project_name",
+    "project_short_description",
+    "license",
+)
+
+
+@dataclass
+class Profile:
+    """Answers of a rendered project, shared by the benchmarks and `tools.golden`.
+
+    Profiles based on the `copier.yml` defaults only take the project identity from
+    the test answers file, everything else comes from the question defaults.
+    """
+
+    name: str
+    overrides: dict[str, Any] = field(default_factory=dict)
+    use_test_answers: bool = False
+
+    def data(self, test_answers: dict[str, Any]) -> dict[str, Any]:
+        """Return the answers passed to copier."""
+        if self.use_test_answers:
+            base = dict(test_answers)
+        else:
+            base = {key: test_answers[key] for key in IDENTITY_KEYS}
+        return {**base, **self.overrides}
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in [
+        Profile("test-answers", use_test_answers=True),
+        Profile("cli-defaults", {"package_type": "cli"}),
+        Profile("cli-argparse", {"package_type": "cli", "cli_framework": "argparse"}),
+        Profile("library-defaults", {"package_type": "library"}),
+        Profile(
+            "namespaced-gitlab-make",
+            {
+                "package_name": "company.mypackage",
+                "distribution_name": "company-mypackage",
+                "task_runner": "make",
+                "git_hosting": "gitlab",
+                "generate_dockerfile": True,
+                "lint_dockerfile": True,
+                "generate_docs": "pdoc",
+            },
+            use_test_answers=True,
+        ),
+        Profile(
+            "namespaced-argparse",
+            {
+                "package_name": "company.mypackage",
+                "distribution_name": "company-mypackage",
+                "package_type": "cli",
+                "cli_framework": "argparse",
+            },
+        ),
+    ]
+}
+
+
+@dataclass
+class Regression:
+    """A metric that grew beyond the tolerated change."""
+
+    profile: str
+    metric: str
+    baseline: float
+    current: float
+
+
+def copy_template(destination: Path) -> Path:
+    """Copy the template files without git metadata, so copier renders them as is."""
+    destination.mkdir(parents=True)
+    for name in TEMPLATE_PATHS:
+        source = REPO_ROOT / name
+        if source.is_dir():
+            shutil.copytree(source, destination / name)
+        else:
+            shutil.copy2(source, destination / name)
+    return destination
+
+
+def render(template: Path, destination: Path, data: dict[str, Any]) -> float:
+    """Render the template into `destination` and return the elapsed seconds."""
+    # Garbage left over from previous renders otherwise makes timings drift upwards.
+    gc.collect()
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        copier.run_copy(
+            str(template), destination, data=data, defaults=True, quiet=True
+        )
+    return time.perf_counter() - start
+
+
+def tree_size(path: Path) -> tuple[int, int]:
+    """Return the number of files and their total size in bytes."""
+    files = [item for item in path.rglob("*") if item.is_file()]
+    return len(files), sum(item.stat().st_size for item in files)
+
+
+def min_seconds(command: list[str], cwd: Path, repeat: int) -> float:
+    """Run `command` `repeat` times and return the fastest wall time."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, check=True, capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure_project(
+    project: Path, data: dict[str, Any], cache_dir: Path, repeat: int
+) -> dict[str, float]:
+    """Measure `uv sync` and the startup times of a generated project."""
+    env = {key: value for key, value in os.environ.items() if key != "VIRTUAL_ENV"}
+    env["UV_CACHE_DIR"] = str(cache_dir)
+    sync = ["uv", "sync", "--quiet"]
+    # The first sync resolves the lock file and fills the cache.
+    subprocess.run(sync, cwd=project, env=env, check=True, capture_output=True)
+    shutil.rmtree(project / ".venv")
+    start = time.perf_counter()
+    subprocess.run(sync, cwd=project, env=env, check=True, capture_output=True)
+    metrics = {"sync_seconds": time.perf_counter() - start}
+
+    bin_dir = project / ".venv" / "bin"
+    python = str(bin_dir / "python")
+    metrics["python_seconds"] = min_seconds([python, "-c", "pass"], project, repeat)
+    import_package = f"import {data['package_name']}"
+    metrics["import_seconds"] = min_seconds(
+        [python, "-c", import_package], project, repeat
+    )
+    if data.get("package_type") == "cli":
+        script = str(bin_dir / data["package_name"].split(".")[-1])
+        metrics["version_seconds"] = min_seconds([script, "--version"], project, repeat)
+    return metrics
+
+
+def run_profile(
+    profile: Profile,
+    template: Path,
+    work_dir: Path,
+    cache_dir: Path,
+    repeat: int,
+    sync: bool = True,
+) -> dict[str, float]:
+    """Render a profile `repeat` times and measure the last generated project."""
+    data = profile.data(yaml.safe_load(TEST_ANSWERS_FILE.read_text()))
+    render_timings = []
+    for index in range(repeat):
+        project = work_dir / profile.name / str(index)
+        render_timings.append(render(template, project, data))
+    files, tree_bytes = tree_size(project)
+    metrics = {
+        "render_seconds": min(render_timings),
+        "files": files,
+        "tree_bytes": tree_bytes,
+    }
+    if sync:
+        metrics.update(measure_project(project, data, cache_dir, repeat))
+    return metrics
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    tolerance: float,
+    min_delta: float,
+) -> list[Regression]:
+    """Return the metrics of `current` that regressed against `baseline`.
+
+    Args:
+        baseline: Results of a previous run.
+        current: Results of this run.
+        tolerance: Allowed relative growth, e.g. `0.2` for 20%.
+        min_delta: Timing changes below this many seconds are never regressions.
+    """
+    regressions = []
+    for profile, metrics in current["profiles"].items():
+        baseline_metrics = baseline["profiles"].get(profile, {})
+        for metric, value in metrics.items():
+            if metric not in baseline_metrics:
+                continue
+            previous = baseline_metrics[metric]
+            if value <= previous * (1 + tolerance):
+                continue
+            if metric.endswith("_seconds") and value - previous < min_delta:
+                continue
+            regressions.append(Regression(profile, metric, previous, value))
+    return regressions
+
+
+def print_report(
+    current: dict[str, Any],
+    baseline: Optional[dict[str, Any]],
+    regressions: list[Regression],
+) -> None:
+    """Print every metric, with its change against the baseline when available."""
+    regressed = {(item.profile, item.metric) for item in regressions}
+    print(f"\n{'profile':<22}  {'metric':<16}  {'current':>12}  {'baseline':>12}")
+    for profile, metrics in current["profiles"].items():
+        previous = (baseline or {}).get("profiles", {}).get(profile, {})
+        for metric, value in metrics.items():
+            line = f"{profile:<22}  {metric:<16}  {_format(metric, value):>12}"
+            if metric in previous:
+                line += f"  {_format(metric, previous[metric]):>12}"
+                if previous[metric]:
+                    line += f"  {value / previous[metric] - 1:+7.1%}"
+            if (profile, metric) in regressed:
+                line += "  REGRESSION"
+            print(line)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the benchmark command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-p",
+        "--profile",
+        action="append",
+        choices=sorted(PROFILES),
+        help="Profile to benchmark, may be repeated (default: all)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per timing, the fastest is kept"
+    )
+    parser.add_argument(
+        "--no-sync",
+        action="store_true",
+        help="Only measure the render, skip uv sync and the startup times",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=BENCH_DIR / "results.json",
+        help="Where the results are written",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BENCH_DIR / "baseline.json",
+        help="Results to compare with, if the file exists",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=20,
+        help="Allowed growth of a metric in percent",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.05,
+        help="Timing changes below this many seconds are not regressions",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=BENCH_DIR / "uv-cache",
+        help="uv cache shared by the benchmarked syncs",
+    )
+    args = parser.parse_args(argv)
+
+    current: dict[str, Any] = {
+        "commit": _git("rev-parse", "HEAD"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "profiles": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="copier-bench-") as work:
+        work_dir = Path(work)
+        template = copy_template(work_dir / "template")
+        for name in args.profile or list(PROFILES):
+            print(f"benchmarking {name}", flush=True)
+            current["profiles"][name] = run_profile(
+                PROFILES[name],
+                template,
+                work_dir / "projects",
+                args.cache_dir.resolve(),
+                args.repeat,
+                sync=not args.no_sync,
+            )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(current, indent=2) + "\n")
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n")
+        print_report(current, None, [])
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    baseline = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+    regressions = (
+        compare(baseline, current, args.tolerance / 100, args.min_delta)
+        if baseline
+        else []
+    )
+    print_report(current, baseline, regressions)
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}, run with --save-baseline first")
+    elif regressions:
+        print(f"\n{len(regressions)} metrics regressed by more than {args.tolerance}%")
+    return 1 if regressions else 0
+
+
+def _format(metric: str, value: float) -> str:
+    if metric.endswith("_seconds"):
+        return f"{value * 1000:.0f} ms"
+    return str(value)
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(REPO_ROOT), *args], capture_output=True, text=True
+    ).stdout.strip()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
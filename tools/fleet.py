@@ -0,0 +1,237 @@
+"""Copy or update many projects from this template in parallel.
+
+The fleet manifest is a YAML file listing the projects to process:
+
+```yaml
+template: https://github.com/flowtaleai/copier-python-uv.git
+vcs_ref: 3.2.0  # optional, defaults to the latest template tag
+projects:
+  - path: ../service-a  # has a .copier-answers.yml, so it is updated
+  - path: ../new-library  # does not exist yet, so it is generated
+    data_file: answers/new-library.yml
+```
+
+Relative paths are resolved against the manifest directory. The template is
+mirrored once into a local cache and every copier run is redirected to that mirror
+through git's `url.<base>.insteadOf` setting, so projects share one set of git
+objects and the `_src_path` stored in their answers files is left untouched.
+
+Usage:
+    uv run python -m tools.fleet fleet.yml --workers 8 --json report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+ANSWERS_FILE = ".copier-answers.yml"
+CONFLICT_MARKER = "<<<<<<< before updating"
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "copier-fleet"
+)
+
+
+@dataclass
+class Project:
+    """A project entry of the fleet manifest."""
+
+    path: Path
+    data_file: Optional[Path] = None
+
+
+@dataclass
+class Manifest:
+    """Template source and projects to copy or update."""
+
+    template: str
+    projects: list[Project]
+    vcs_ref: Optional[str] = None
+
+    @classmethod
+    def load(cls, path: Path) -> Manifest:
+        """Read a manifest, resolving project paths against its directory."""
+        content = yaml.safe_load(path.read_text())
+        base = path.parent
+
+        def resolve(value: str) -> Path:
+            return (base / Path(value).expanduser()).resolve()
+
+        projects = [
+            Project(
+                path=resolve(entry["path"]),
+                data_file=resolve(entry["data_file"]) if "data_file" in entry else None,
+            )
+            for entry in content["projects"]
+        ]
+        return cls(
+            template=content["template"],
+            projects=projects,
+            vcs_ref=content.get("vcs_ref"),
+        )
+
+
+@dataclass
+class Result:
+    """Outcome of copying or updating a single project."""
+
+    path: Path
+    action: str
+    status: str
+    seconds: float
+    conflicts: list[str] = field(default_factory=list)
+    error: str = ""
+
+
+def sync_template_mirror(template: str, cache_dir: Path) -> Path:
+    """Create or refresh the local mirror of `template` and return its path."""
+    digest = hashlib.sha256(template.encode()).hexdigest()[:16]
+    mirror = cache_dir / f"{digest}.git"
+    if mirror.exists():
+        _git("--git-dir", str(mirror), "remote", "update", "--prune")
+    else:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _git("clone", "--quiet", "--mirror", template, str(mirror))
+    return mirror
+
+
+def mirror_env(template: str, mirror: Path) -> dict[str, str]:
+    """Return an environment in which git fetches `template` from `mirror`."""
+    env = dict(os.environ)
+    index = int(env.get("GIT_CONFIG_COUNT", "0"))
+    env["GIT_CONFIG_COUNT"] = str(index + 1)
+    env[f"GIT_CONFIG_KEY_{index}"] = f"url.{mirror}.insteadOf"
+    env[f"GIT_CONFIG_VALUE_{index}"] = template
+    return env
+
+
+def run_project(project: Project, manifest: Manifest, env: dict[str, str]) -> Result:
+    """Update `project` if it was generated before, otherwise generate it."""
+    command = [sys.executable, "-m", "copier"]
+    if (project.path / ANSWERS_FILE).exists():
+        action = "update"
+        command += ["update", "--conflict", "inline"]
+    else:
+        action = "copy"
+        command += ["copy"]
+    command += ["--defaults", "--quiet"]
+    if manifest.vcs_ref:
+        command += ["--vcs-ref", manifest.vcs_ref]
+    if project.data_file:
+        command += ["--data-file", str(project.data_file)]
+    if action == "copy":
+        command.append(manifest.template)
+    command.append(str(project.path))
+
+    start = time.perf_counter()
+    process = subprocess.run(command, env=env, capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+    if process.returncode != 0:
+        error_lines = process.stderr.strip().splitlines() or ["copier failed"]
+        return Result(project.path, action, "failed", seconds, error=error_lines[-1])
+    conflicts = find_conflicts(project.path) if action == "update" else []
+    status = "conflict" if conflicts else "ok"
+    return Result(project.path, action, status, seconds, conflicts=conflicts)
+
+
+def find_conflicts(path: Path) -> list[str]:
+    """List files of an updated project with unresolved merge conflicts."""
+    changed = _git("-C", str(path), "status", "--porcelain", "--untracked-files=all")
+    conflicts = []
+    for line in changed.splitlines():
+        state, name = line[:2], line[3:]
+        file_path = path / name
+        if "U" in state or state in ("AA", "DD") or name.endswith(".rej"):
+            conflicts.append(name)
+        elif file_path.is_file() and CONFLICT_MARKER in _read_text(file_path):
+            conflicts.append(name)
+    return conflicts
+
+
+def run_fleet(manifest: Manifest, workers: int, cache_dir: Path) -> list[Result]:
+    """Copy or update all projects of `manifest` with a bounded worker pool."""
+    mirror = sync_template_mirror(manifest.template, cache_dir)
+    env = mirror_env(manifest.template, mirror)
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_project, project, manifest, env)
+            for project in manifest.projects
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            print(f"{result.status:>8}  {result.action:<6}  {result.path}", flush=True)
+            results.append(result)
+    return sorted(results, key=lambda result: str(result.path))
+
+
+def print_report(results: list[Result]) -> None:
+    """Print a per-project summary table."""
+    print(f"\n{'status':<8}  {'action':<6}  {'time':>7}  project")
+    for result in results:
+        print(
+            f"{result.status:<8}  {result.action:<6}  {result.seconds:>6.1f}s "
+            f" {result.path}"
+        )
+        for conflict in result.conflicts:
+            print(f"{'':<27}conflict: {conflict}")
+        if result.error:
+            print(f"{'':<27}error: {result.error}")
+    total = sum(result.seconds for result in results)
+    print(f"\n{len(results)} projects, {total:.1f}s of copier time")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the fleet command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("manifest", type=Path, help="Fleet manifest (YAML)")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=os.cpu_count() or 4, help="Pool size"
+    )
+    parser.add_argument("--vcs-ref", help="Template git ref overriding the manifest")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Where the template mirror is kept",
+    )
+    parser.add_argument("--json", type=Path, help="Also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    manifest = Manifest.load(args.manifest)
+    if args.vcs_ref:
+        manifest.vcs_ref = args.vcs_ref
+    results = run_fleet(manifest, args.workers, args.cache_dir)
+    print_report(results)
+    if args.json:
+        report = [{**asdict(result), "path": str(result.path)} for result in results]
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+    return 0 if all(result.status == "ok" for result in results) else 1
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+        ["git", *args], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def _read_text(path: Path) -> str:
+    try:
+        return path.read_text()
+    except UnicodeDecodeError:
+        return ""
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+"""Compare rendered projects with golden per-file digests.
+
+For each answer profile the template is rendered and the SHA-256 digest of every
+generated file is compared with the manifest stored in `tests/golden/`. A single
+render per profile thus covers the whole generated tree, including the files the
+unit tests do not look at.
+
+Content that changes between renders, such as the template path in the answers
+file or the copyright year, is normalized before hashing. When a digest differs,
+the file is rendered again from the committed template (`HEAD`) and the unified
+diff between both renders is shown.
+
+Usage:
+    uv run python -m tools.golden            # check the working tree
+    uv run python -m tools.golden --update   # accept the rendered output
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import hashlib
+import io
+import json
+import re
+import subprocess
+import sys
+import tarfile
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+from tools.bench import (
+    PROFILES,
+    REPO_ROOT,
+    TEMPLATE_PATHS,
+    TEST_ANSWERS_FILE,
+    Profile,
+    copy_template,
+    render,
+)
+
+GOLDEN_DIR = REPO_ROOT / "tests" / "golden"
+MAX_DIFF_LINES = 200
+
+# (file name pattern, content pattern, replacement) applied before hashing
+NORMALIZATIONS = [
+    (r"\.copier-answers\.yml", rb"(?m)^_src_path: .*$", rb"_src_path: <template>"),
+    (r"\.copier-answers\.yml", rb"(?m)^_commit: .*$", rb"_commit: <commit>"),
+    (r"LICENSE", rb"(Copyright \([cC]\)) \d{4}", rb"\1 <year>"),
+]
+
+
+@dataclass
+class Changes:
+    """Files of a rendered profile that differ from its golden manifest."""
+
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Whether any file differs."""
+        return bool(self.added or self.removed or self.changed)
+
+
+def normalize(relative_path: str, content: bytes) -> bytes:
+    """Replace the content that differs between renders with placeholders."""
+    for file_pattern, pattern, replacement in NORMALIZATIONS:
+        if re.fullmatch(file_pattern, relative_path):
+            content = re.sub(pattern, replacement, content)
+    return content
+
+
+def read_normalized(root: Path, relative_path: str) -> bytes:
+    """Read a rendered file with `normalize` applied."""
+    return normalize(relative_path, (root / relative_path).read_bytes())
+
+
+def digest_tree(root: Path) -> dict[str, str]:
+    """Return the digest of every file under `root`, keyed by relative path."""
+    digests = {}
+    for path in sorted(root.rglob("*")):
+        if path.is_file():
+            relative_path = path.relative_to(root).as_posix()
+            content = read_normalized(root, relative_path)
+            digests[relative_path] = hashlib.sha256(content).hexdigest()
+    return digests
+
+
+def manifest_path(profile: Profile) -> Path:
+    """Return the golden manifest of `profile`."""
+    return GOLDEN_DIR / f"{profile.name}.json"
+
+
+def load_manifest(profile: Profile) -> dict[str, str]:
+    """Return the golden digests of `profile`, empty if there are none yet."""
+    path = manifest_path(profile)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["files"]
+
+
+def save_manifest(profile: Profile, digests: dict[str, str]) -> None:
+    """Store `digests` as the golden manifest of `profile`."""
+    GOLDEN_DIR.mkdir(parents=True, exist_ok=True)
+    content = {"profile": profile.name, "files": digests}
+    manifest_path(profile).write_text(json.dumps(content, indent=2) + "\n")
+
+
+def render_profile(profile: Profile, template: Path, destination: Path) -> Path:
+    """Render `profile` from `template` into `destination`."""
+    data = profile.data(yaml.safe_load(TEST_ANSWERS_FILE.read_text()))
+    render(template, destination, data)
+    return destination
+
+
+def compare(golden: dict[str, str], current: dict[str, str]) -> Changes:
+    """Return the files that were added, removed or changed in `current`."""
+    return Changes(
+        added=sorted(current.keys() - golden.keys()),
+        removed=sorted(golden.keys() - current.keys()),
+        changed=sorted(
+            path
+            for path in golden.keys() & current.keys()
+            if golden[path] != current[path]
+        ),
+    )
+
+
+def export_template(ref: str, destination: Path) -> Path:
+    """Extract the template files committed at `ref` into `destination`."""
+    archive = subprocess.run(
+        ["git", "-C", str(REPO_ROOT), "archive", "--format=tar", ref] + TEMPLATE_PATHS,
+        check=True,
+        capture_output=True,
+    ).stdout
+    destination.mkdir(parents=True)
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(destination, filter="data")
+    return destination
+
+
+def file_diff(reference: Path, current: Path, relative_path: str) -> list[str]:
+    """Return the unified diff of a file between two renders."""
+
+    def lines(root: Path) -> list[str]:
+        if not (root / relative_path).exists():
+            return []
+        content = read_normalized(root, relative_path)
+        return content.decode(errors="replace").splitlines(keepends=True)
+
+    return list(
+        difflib.unified_diff(
+            lines(reference),
+            lines(current),
+            fromfile=f"HEAD/{relative_path}",
+            tofile=f"working tree/{relative_path}",
+        )
+    )
+
+
+def report(
+    profile: Profile,
+    changes: Changes,
+    current: Path,
+    reference: Optional[Path] = None,
+) -> str:
+    """Describe `changes`, with file diffs against the `reference` render."""
+    lines = [f"{profile.name}: rendered tree differs from {manifest_path(profile)}"]
+    for label, paths in [
+        ("added", changes.added),
+        ("removed", changes.removed),
+        ("changed", changes.changed),
+    ]:
+        lines += [f"  {label}: {path}" for path in paths]
+    if reference is not None:
+        diff: list[str] = []
+        for path in changes.added + changes.removed + changes.changed:
+            diff += file_diff(reference, current, path)
+        if not diff:
+            lines.append(
+                "\nThe committed template renders the same files, the golden"
+                " manifest is out of date."
+            )
+        elif len(diff) > MAX_DIFF_LINES:
+            omitted = len(diff) - MAX_DIFF_LINES
+            diff = diff[:MAX_DIFF_LINES] + [f"... {omitted} more lines\n"]
+        lines.append("".join(diff).rstrip("\n"))
+    lines.append("\nIf the change is intended, run: just golden --update")
+    return "\n".join(lines)
+
+
+def check_profile(
+    profile: Profile, template: Path, work_dir: Path, update: bool = False
+) -> Optional[str]:
+    """Render `profile` and return a report if it differs from its manifest."""
+    current = render_profile(profile, template, work_dir / "current" / profile.name)
+    digests = digest_tree(current)
+    if update:
+        save_manifest(profile, digests)
+        return None
+    changes = compare(load_manifest(profile), digests)
+    if not changes:
+        return None
+    reference_template = work_dir / "reference-template"
+    if not reference_template.exists():
+        export_template("HEAD", reference_template)
+    reference = render_profile(
+        profile, reference_template, work_dir / "reference" / profile.name
+    )
+    return report(profile, changes, current, reference)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the golden manifest command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-p",
+        "--profile",
+        action="append",
+        choices=sorted(PROFILES),
+        help="Profile to check, may be repeated (default: all)",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Write the rendered digests as the new golden manifests",
+    )
+    args = parser.parse_args(argv)
+
+    failures = 0
+    with tempfile.TemporaryDirectory(prefix="copier-golden-") as work:
+        work_dir = Path(work)
+        template = copy_template(work_dir / "template")
+        for name in args.profile or list(PROFILES):
+            result = check_profile(PROFILES[name], template, work_dir, args.update)
+            if args.update:
+                print(f"updated {manifest_path(PROFILES[name])}")
+            elif result is None:
+                print(f"{name}: ok")
+            else:
+                failures += 1
+                print(result)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())